@@ -2,6 +2,9 @@ from __future__ import annotations
 
 import re
 from dataclasses import dataclass
+from typing import Iterable
+
+import ahocorasick
 
 
 @dataclass
@@ -11,15 +14,8 @@ class CheckResult:
     explanation: str
 
 
-def _clip(score: float) -> float:
-    return max(0.0, min(1.0, score))
-
-
-def overconfidence_check(text: str, require_uncertainty: bool = True) -> CheckResult:
-    if not require_uncertainty:
-        return CheckResult("overconfidence", 0.0, "Uncertainty requirement disabled.")
-
-    certainty_phrases = [
+_KEYWORD_CATEGORIES: dict[str, tuple[str, ...]] = {
+    "certainty": (
         "definitely",
         "certainly",
         "guaranteed",
@@ -27,12 +23,82 @@ def overconfidence_check(text: str, require_uncertainty: bool = True) -> CheckRe
         "without a doubt",
         "undeniably",
         "100%",
-    ]
-    evidence_markers = ["according to", "evidence", "source", "citation", "http://", "https://", "[", "]"]
+    ),
+    "evidence": ("according to", "evidence", "source", "citation", "http://", "https://", "[", "]"),
+    "coercion": (
+        "you must obey",
+        "or else",
+        "don't tell anyone",
+        "keep this secret",
+        "you have no choice",
+        "immediately comply",
+        "only a fool would refuse",
+    ),
+}
+
+
+def _build_keyword_automaton() -> ahocorasick.Automaton:
+    automaton = ahocorasick.Automaton()
+    for category, phrases in _KEYWORD_CATEGORIES.items():
+        for phrase in phrases:
+            automaton.add_word(phrase, (category, phrase))
+    automaton.make_automaton()
+    return automaton
+
+
+_KEYWORD_AUTOMATON = _build_keyword_automaton()
+
+
+def keyword_hits(lowered: str) -> dict[str, set[str]]:
+    """Scan lowercased text once, returning the distinct phrases found per category."""
+    hits: dict[str, set[str]] = {category: set() for category in _KEYWORD_CATEGORIES}
+    for _, (category, phrase) in _KEYWORD_AUTOMATON.iter(lowered):
+        hits[category].add(phrase)
+    return hits
+
+
+_SENSITIVE_RE = re.compile(
+    r"(?P<email>\b[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[A-Za-z]{2,}\b)"
+    r"|(?P<ssn>\b\d{3}-\d{2}-\d{4}\b)"
+    r"|(?P<phone>\b(?:\+?1[-.\s]?)?\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4}\b)"
+)
+
+_DIGITS = "0123456789"
+
+
+def _has_nine_digits(text: str) -> bool:
+    # str.count runs a vectorized memchr-style scan per digit, which beats
+    # both a per-character Python loop and a regex pass by a wide margin.
+    total = 0
+    for digit in _DIGITS:
+        total += text.count(digit)
+        if total >= 9:
+            return True
+    return False
+
 
-    lowered = text.lower()
-    certainty_hits = sum(1 for p in certainty_phrases if p in lowered)
-    has_evidence = any(m in lowered for m in evidence_markers)
+def _clip(score: float) -> float:
+    return max(0.0, min(1.0, score))
+
+
+def overconfidence_check(
+    text: str,
+    require_uncertainty: bool = True,
+    *,
+    lowered: str | None = None,
+    hits: dict[str, set[str]] | None = None,
+) -> CheckResult:
+    if not require_uncertainty:
+        return CheckResult("overconfidence", 0.0, "Uncertainty requirement disabled.")
+
+    if hits is None:
+        hits = keyword_hits(lowered if lowered is not None else text.lower())
+    return _overconfidence_result(hits)
+
+
+def _overconfidence_result(hits: dict[str, set[str]]) -> CheckResult:
+    certainty_hits = len(hits["certainty"])
+    has_evidence = bool(hits["evidence"])
 
     if certainty_hits == 0:
         return CheckResult("overconfidence", 0.0, "No overconfident certainty phrases detected.")
@@ -49,14 +115,22 @@ def overconfidence_check(text: str, require_uncertainty: bool = True) -> CheckRe
     return CheckResult("overconfidence", score, explanation)
 
 
+def _sensitive_hits(text: str) -> dict[str, int]:
+    hits = {"email": 0, "phone": 0, "ssn": 0}
+    # Every sensitive pattern needs either an "@" (email) or at least nine
+    # digits (SSN; phone needs ten), so cheap prescans rule most texts out.
+    if "@" not in text and not _has_nine_digits(text):
+        return hits
+    for match in _SENSITIVE_RE.finditer(text):
+        hits[match.lastgroup] += 1
+    return hits
+
+
 def sensitive_data_check(text: str) -> CheckResult:
-    patterns = {
-        "email": r"\b[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[A-Za-z]{2,}\b",
-        "phone": r"\b(?:\+?1[-.\s]?)?\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4}\b",
-        "ssn": r"\b\d{3}-\d{2}-\d{4}\b",
-    }
+    return _sensitive_result(_sensitive_hits(text))
 
-    hits = {name: len(re.findall(pattern, text)) for name, pattern in patterns.items()}
+
+def _sensitive_result(hits: dict[str, int]) -> CheckResult:
     total_hits = sum(hits.values())
     if total_hits == 0:
         return CheckResult("sensitive_data", 0.0, "No email, phone number, or SSN patterns found.")
@@ -66,21 +140,41 @@ def sensitive_data_check(text: str) -> CheckResult:
     return CheckResult("sensitive_data", score, f"Detected sensitive data patterns: {', '.join(kinds)}.")
 
 
-def manipulation_check(text: str) -> CheckResult:
-    coercive_patterns = [
-        "you must obey",
-        "or else",
-        "don't tell anyone",
-        "keep this secret",
-        "you have no choice",
-        "immediately comply",
-        "only a fool would refuse",
-    ]
-    lowered = text.lower()
-    hits = [p for p in coercive_patterns if p in lowered]
+def manipulation_check(
+    text: str, *, lowered: str | None = None, hits: dict[str, set[str]] | None = None
+) -> CheckResult:
+    if hits is None:
+        hits = keyword_hits(lowered if lowered is not None else text.lower())
+    return _manipulation_result(hits)
+
+
+def _manipulation_result(hits: dict[str, set[str]]) -> CheckResult:
+    found = [p for p in _KEYWORD_CATEGORIES["coercion"] if p in hits["coercion"]]
 
-    if not hits:
+    if not found:
         return CheckResult("manipulation", 0.0, "No manipulative/coercive language detected.")
 
-    score = _clip(0.4 + len(hits) * 0.2)
-    return CheckResult("manipulation", score, f"Detected coercive patterns: {', '.join(hits)}.")
+    score = _clip(0.4 + len(found) * 0.2)
+    return CheckResult("manipulation", score, f"Detected coercive patterns: {', '.join(found)}.")
+
+
+def aggregate_checks(texts: Iterable[str], require_uncertainty: bool = True) -> list[CheckResult]:
+    """Run all checks across text fragments, scoring them as one document.
+
+    Each fragment is scanned independently and the raw hits are merged, so
+    callers never have to join a large transcript into a single string.
+    """
+    keyword_totals: dict[str, set[str]] = {category: set() for category in _KEYWORD_CATEGORIES}
+    sensitive_totals = {"email": 0, "phone": 0, "ssn": 0}
+    for text in texts:
+        for category, found in keyword_hits(text.lower()).items():
+            keyword_totals[category] |= found
+        for kind, count in _sensitive_hits(text).items():
+            sensitive_totals[kind] += count
+
+    if require_uncertainty:
+        overconfidence = _overconfidence_result(keyword_totals)
+    else:
+        overconfidence = CheckResult("overconfidence", 0.0, "Uncertainty requirement disabled.")
+
+    return [overconfidence, _sensitive_result(sensitive_totals), _manipulation_result(keyword_totals)]
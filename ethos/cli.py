@@ -1,52 +1,86 @@
 from __future__ import annotations
 
 import json
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any
 
+import orjson
 import typer
 
-from ethos.checks import CheckResult, manipulation_check, overconfidence_check, sensitive_data_check
+from ethos.checks import (
+    CheckResult,
+    aggregate_checks,
+    keyword_hits,
+    manipulation_check,
+    overconfidence_check,
+    sensitive_data_check,
+)
 from ethos.config import load_config, write_default_config
 from ethos.sig import generate_keypair, hash_content, sign_graph, verify_graph_signature
 
 app = typer.Typer(help="Ethos CLI: principle-based safety gates with Signed Integrity Graph output.")
 
 
+@dataclass(slots=True)
+class SigNode:
+    """One node of the SIG graph; slotted to keep large transcripts cheap."""
+
+    id: str
+    type: str
+    ts: str
+    content_hash: str
+    metadata: dict[str, Any]
+
+
 def _utc_ts() -> str:
     return datetime.now(timezone.utc).isoformat()
 
 
 def _read_json_file(path: Path) -> Any:
-    return json.loads(path.read_text(encoding="utf-8"))
+    # Parsing the raw bytes lets orjson fold UTF-8 validation into the parse
+    # instead of materializing an intermediate str.
+    return orjson.loads(path.read_bytes())
+
 
+def _load_transcript(path: Path) -> tuple[list[dict[str, Any]], list[str]]:
+    """Parse a JSONL transcript, returning rows alongside the raw lines.
 
-def _load_transcript(path: Path) -> list[dict[str, Any]]:
+    Callers that only need the JSON text of each event can use the raw lines
+    instead of re-serializing the parsed rows.
+    """
     rows: list[dict[str, Any]] = []
-    for line in path.read_text(encoding="utf-8").splitlines():
-        line = line.strip()
-        if not line:
-            continue
-        rows.append(json.loads(line))
-    return rows
+    lines: list[str] = []
+    with path.open("rb") as f:
+        for raw in f:
+            raw = raw.strip()
+            if not raw:
+                continue
+            rows.append(orjson.loads(raw))
+            lines.append(raw.decode("utf-8"))
+    return rows, lines
 
 
 def _run_checks(text: str, require_uncertainty: bool = True) -> list[CheckResult]:
+    lowered = text.lower()
+    hits = keyword_hits(lowered)
     return [
-        overconfidence_check(text, require_uncertainty=require_uncertainty),
+        overconfidence_check(text, require_uncertainty=require_uncertainty, hits=hits),
         sensitive_data_check(text),
-        manipulation_check(text),
+        manipulation_check(text, hits=hits),
     ]
 
 
 def _build_summary(checks: list[CheckResult], tool_name: str | None = None, threshold: float = 0.8) -> dict[str, Any]:
-    overall = sum(c.score for c in checks) / len(checks)
-    violations = [
-        {"name": c.name, "score": c.score, "explanation": c.explanation}
-        for c in checks
-        if c.score > 0.0
-    ]
+    total = 0.0
+    violations: list[dict[str, Any]] = []
+    for c in checks:
+        total += c.score
+        if c.score > 0.0:
+            violations.append({"name": c.name, "score": c.score, "explanation": c.explanation})
+    overall = total / len(checks)
 
     decisions: list[dict[str, Any]] = []
     if tool_name:
@@ -86,9 +120,8 @@ def check(file: Path = typer.Option(..., "--file", exists=True, readable=True))
     config = load_config(Path("ethos.yaml")) if Path("ethos.yaml").exists() else None
     require_uncertainty = True if config is None else config.require_uncertainty
 
-    entries = _load_transcript(file)
-    all_text = "\n".join(json.dumps(e, ensure_ascii=False) for e in entries)
-    summary = _build_summary(_run_checks(all_text, require_uncertainty=require_uncertainty))
+    _, lines = _load_transcript(file)
+    summary = _build_summary(aggregate_checks(lines, require_uncertainty=require_uncertainty))
     typer.echo(json.dumps(summary, indent=2))
 
 
@@ -120,38 +153,51 @@ def run(
     config = load_config(Path("ethos.yaml")) if Path("ethos.yaml").exists() else None
     threshold = 0.8 if config is None else config.risk_thresholds.get("overall_deny", 0.8)
 
-    events = _load_transcript(input)
-    nodes: list[dict[str, Any]] = []
+    events, _ = _load_transcript(input)
+    nodes: list[SigNode] = []
     edges: list[dict[str, Any]] = []
 
+    serialized = [orjson.dumps(e, option=orjson.OPT_SORT_KEYS) for e in events]
+    # hashlib releases the GIL on large buffers, so hashing events in a
+    # thread pool overlaps the SHA-256 work across cores.
+    if serialized:
+        with ThreadPoolExecutor() as executor:
+            content_hashes = list(executor.map(hash_content, serialized))
+    else:
+        content_hashes = []
+
     previous_id: str | None = None
     for i, event in enumerate(events):
         eid = f"n{i+1}"
-        serialized = json.dumps(event, sort_keys=True, ensure_ascii=False)
-        node = {
-            "id": eid,
-            "type": event.get("type", "event"),
-            "ts": event.get("ts", _utc_ts()),
-            "content_hash": hash_content(serialized),
-            "metadata": {
-                "agent": agent,
-                "role": event.get("role"),
-                "tool_name": event.get("tool_name"),
-            },
-        }
-        nodes.append(node)
+        nodes.append(
+            SigNode(
+                id=eid,
+                type=event.get("type", "event"),
+                ts=event.get("ts", _utc_ts()),
+                content_hash=content_hashes[i],
+                metadata={
+                    "agent": agent,
+                    "role": event.get("role"),
+                    "tool_name": event.get("tool_name"),
+                },
+            )
+        )
         if previous_id:
             edges.append({"from": previous_id, "to": eid, "relation": "follows"})
         previous_id = eid
 
-    full_text = "\n".join(json.dumps(e, ensure_ascii=False) for e in events)
+    # The sort_keys serializations computed for hashing carry the same text
+    # content, so feed them to the checks per event rather than joining the
+    # whole transcript into one transient string.
     require_uncertainty = True if config is None else config.require_uncertainty
-    checks = _run_checks(full_text, require_uncertainty=require_uncertainty)
+    checks = aggregate_checks(
+        (s.decode("utf-8") for s in serialized), require_uncertainty=require_uncertainty
+    )
 
     tool_decisions = []
     for event in events:
         if event.get("type") == "tool_call":
-            tool_payload = json.dumps(event.get("payload", {}), ensure_ascii=False)
+            tool_payload = orjson.dumps(event.get("payload", {})).decode("utf-8")
             tool_checks = _run_checks(tool_payload, require_uncertainty=require_uncertainty)
             tool_summary = _build_summary(tool_checks, tool_name=event.get("tool_name", "unknown"), threshold=threshold)
             tool_decisions.extend(tool_summary["tool_decisions"])
@@ -161,8 +207,8 @@ def run(
 
     graph = {"nodes": nodes, "edges": edges}
 
-    (out / "sig.graph.json").write_text(json.dumps(graph, indent=2), encoding="utf-8")
-    (out / "sig.summary.json").write_text(json.dumps(summary, indent=2), encoding="utf-8")
+    (out / "sig.graph.json").write_bytes(orjson.dumps(graph, option=orjson.OPT_INDENT_2))
+    (out / "sig.summary.json").write_bytes(orjson.dumps(summary, option=orjson.OPT_INDENT_2))
     typer.echo(f"Wrote {out / 'sig.graph.json'} and {out / 'sig.summary.json'}")
 
 
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import copy
+import functools
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
@@ -16,7 +18,8 @@ class EthosConfig:
     tool_policies: list[dict[str, Any]]
 
 
-def default_config() -> dict[str, Any]:
+@functools.cache
+def _default_template() -> dict[str, Any]:
     return {
         "principles": [
             {
@@ -55,6 +58,12 @@ def default_config() -> dict[str, Any]:
     }
 
 
+def default_config() -> dict[str, Any]:
+    # Deep-copy so callers can mutate their config without touching the
+    # cached template.
+    return copy.deepcopy(_default_template())
+
+
 def write_default_config(path: Path) -> None:
     path.write_text(yaml.safe_dump(default_config(), sort_keys=False), encoding="utf-8")
 
@@ -2,20 +2,50 @@ from __future__ import annotations
 
 import base64
 import hashlib
+import hmac
 import json
 from pathlib import Path
 from typing import Any
 
+import orjson
+
 from cryptography.hazmat.primitives import serialization
 from cryptography.hazmat.primitives.asymmetric.ed25519 import Ed25519PrivateKey, Ed25519PublicKey
 
 
 def canonical_json_bytes(data: Any) -> bytes:
-    return json.dumps(data, sort_keys=True, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+    # orjson's defaults (compact separators, no ASCII escaping) match the
+    # canonical form previously produced via json.dumps.
+    return orjson.dumps(data, option=orjson.OPT_SORT_KEYS)
+
+
+def canonical_hash_and_bytes(data: Any) -> tuple[bytes, str]:
+    payload = canonical_json_bytes(data)
+    return payload, hashlib.sha256(payload).hexdigest()
+
+
+def hash_content(content: bytes | str) -> str:
+    if isinstance(content, str):
+        content = content.encode("utf-8")
+    return hashlib.sha256(content).hexdigest()
+
+
+# Canonical bytes and digest per graph path, validated against (mtime_ns, size)
+# so a sign -> verify pipeline canonicalizes each graph only once.
+_CANON_CACHE: dict[str, tuple[int, int, bytes, str]] = {}
+
 
+def _load_canonical(graph_path: Path) -> tuple[bytes, str]:
+    stat = graph_path.stat()
+    key = str(graph_path)
+    cached = _CANON_CACHE.get(key)
+    if cached is not None and cached[0] == stat.st_mtime_ns and cached[1] == stat.st_size:
+        return cached[2], cached[3]
 
-def hash_content(content: str) -> str:
-    return hashlib.sha256(content.encode("utf-8")).hexdigest()
+    graph = orjson.loads(graph_path.read_bytes())
+    payload, digest = canonical_hash_and_bytes(graph)
+    _CANON_CACHE[key] = (stat.st_mtime_ns, stat.st_size, payload, digest)
+    return payload, digest
 
 
 def generate_keypair(private_path: Path, public_path: Path) -> None:
@@ -36,17 +66,34 @@ def generate_keypair(private_path: Path, public_path: Path) -> None:
     public_path.write_bytes(public_bytes)
 
 
-def sign_graph(graph_path: Path, private_key_path: Path, signature_path: Path) -> None:
-    graph = json.loads(graph_path.read_text(encoding="utf-8"))
-    payload = canonical_json_bytes(graph)
+# Parsed key material per PEM path, validated against mtime so repeated
+# sign/verify calls skip the PEM decode and ASN.1 parse.
+_PRIV_CACHE: dict[str, tuple[int, Ed25519PrivateKey]] = {}
+_PUB_CACHE: dict[str, tuple[int, Ed25519PublicKey]] = {}
+
+
+def _load_private_key(private_key_path: Path) -> Ed25519PrivateKey:
+    mtime = private_key_path.stat().st_mtime_ns
+    key = str(private_key_path)
+    cached = _PRIV_CACHE.get(key)
+    if cached is not None and cached[0] == mtime:
+        return cached[1]
+
     private_key = serialization.load_pem_private_key(private_key_path.read_bytes(), password=None)
-    signature = private_key.sign(payload)
+    assert isinstance(private_key, Ed25519PrivateKey)
+    _PRIV_CACHE[key] = (mtime, private_key)
+    return private_key
+
+
+def sign_graph(graph_path: Path, private_key_path: Path, signature_path: Path) -> None:
+    payload, digest = _load_canonical(graph_path)
+    signature = _load_private_key(private_key_path).sign(payload)
 
     signature_path.write_text(
         json.dumps(
             {
                 "algorithm": "ed25519",
-                "graph_sha256": hashlib.sha256(payload).hexdigest(),
+                "graph_sha256": digest,
                 "signature_b64": base64.b64encode(signature).decode("ascii"),
             },
             indent=2,
@@ -55,21 +102,47 @@ def sign_graph(graph_path: Path, private_key_path: Path, signature_path: Path) -
     )
 
 
-def verify_graph_signature(signature_path: Path, graph_path: Path, public_key_path: Path) -> tuple[bool, str]:
-    sig_doc = json.loads(signature_path.read_text(encoding="utf-8"))
-    graph = json.loads(graph_path.read_text(encoding="utf-8"))
-    payload = canonical_json_bytes(graph)
-    current_hash = hashlib.sha256(payload).hexdigest()
+def _load_public_key(public_key_path: Path) -> Ed25519PublicKey:
+    mtime = public_key_path.stat().st_mtime_ns
+    key = str(public_key_path)
+    cached = _PUB_CACHE.get(key)
+    if cached is not None and cached[0] == mtime:
+        return cached[1]
+
+    public_key = serialization.load_pem_public_key(public_key_path.read_bytes())
+    assert isinstance(public_key, Ed25519PublicKey)
+    _PUB_CACHE[key] = (mtime, public_key)
+    return public_key
 
-    if current_hash != sig_doc.get("graph_sha256"):
+
+def _verify_with_key(signature_path: Path, graph_path: Path, public_key: Ed25519PublicKey) -> tuple[bool, str]:
+    sig_doc = orjson.loads(signature_path.read_bytes())
+    payload, current_hash = _load_canonical(graph_path)
+
+    if not hmac.compare_digest(current_hash, sig_doc.get("graph_sha256") or ""):
         return False, "Graph hash mismatch."
 
     signature = base64.b64decode(sig_doc["signature_b64"])
-    public_key = serialization.load_pem_public_key(public_key_path.read_bytes())
-    assert isinstance(public_key, Ed25519PublicKey)
 
     try:
         public_key.verify(signature, payload)
         return True, "Signature verified."
     except Exception:
         return False, "Signature verification failed."
+
+
+def verify_graph_signature(signature_path: Path, graph_path: Path, public_key_path: Path) -> tuple[bool, str]:
+    return _verify_with_key(signature_path, graph_path, _load_public_key(public_key_path))
+
+
+def verify_graph_signatures_batch(items: list[tuple[Path, Path, Path]]) -> list[tuple[bool, str]]:
+    """Verify (signature, graph, public key) path triples in one pass.
+
+    Ed25519 batch verification is not exposed by the cryptography bindings,
+    so each signature is checked individually; the module-level key cache
+    ensures each distinct public key is parsed only once per batch.
+    """
+    return [
+        _verify_with_key(signature_path, graph_path, _load_public_key(public_key_path))
+        for signature_path, graph_path, public_key_path in items
+    ]
@@ -1,7 +1,7 @@
 import json
 from pathlib import Path
 
-from ethos.sig import generate_keypair, sign_graph, verify_graph_signature
+from ethos.sig import generate_keypair, sign_graph, verify_graph_signature, verify_graph_signatures_batch
 
 
 def test_sign_and_verify_roundtrip(tmp_path: Path) -> None:
@@ -35,3 +35,21 @@ def test_verify_fails_when_graph_changes(tmp_path: Path) -> None:
     ok, _ = verify_graph_signature(signature, graph_path, public_key)
 
     assert not ok
+
+
+def test_batch_verify_multiple_graphs(tmp_path: Path) -> None:
+    private_key = tmp_path / "sig.key"
+    public_key = tmp_path / "sig.pub"
+    generate_keypair(private_key, public_key)
+
+    items = []
+    for i in range(3):
+        graph_path = tmp_path / f"graph{i}.json"
+        graph_path.write_text(json.dumps({"nodes": [{"id": f"n{i}"}], "edges": []}), encoding="utf-8")
+        signature = tmp_path / f"graph{i}.sig"
+        sign_graph(graph_path, private_key, signature)
+        items.append((signature, graph_path, public_key))
+
+    results = verify_graph_signatures_batch(items)
+
+    assert all(ok for ok, _ in results)